@@ -0,0 +1,188 @@
+import codecs
+import itertools
+import os
+from array import array
+
+
+class PuzzleIO:
+    CELL_CHARS = "0123456789."
+    SEPARATOR_CHARS = "|-+ \t"
+    TEXT_FILTER = "Text files (*.txt)"
+    SDK_FILTER = "SDK files (*.sdk)"
+    FILE_FILTER = ";;".join(["Sudoku files (*.txt *.sdk)", TEXT_FILTER, SDK_FILTER, "All files (*)"])
+    MAX_LINE_BYTES = 4096
+    SKIP_CHUNK_BYTES = 1 << 20
+
+    @staticmethod
+    def parse_line(text):
+        if len(text) != 81 or any(ch not in PuzzleIO.CELL_CHARS for ch in text):
+            return None
+        return [[0 if ch in "0." else int(ch) for ch in text[i:i + 9]] for i in range(0, 81, 9)]
+
+    @staticmethod
+    def scan_entries(lines):
+        # Takes (position, line) pairs and yields (position of the entry's first line, text) for
+        # every entry, valid or not, so entry numbers match the file. Positions are line numbers
+        # for text streams and byte offsets for PuzzleIndex. Accepts one-puzzle-per-line
+        # collections and .sdk grids; only the chosen entry is parsed
+        rows, start = [], 0
+        for position, line in lines:
+            line = line.strip()
+            if not line or line[0] in "#;":
+                if rows:
+                    yield start, "".join(rows)
+                    rows = []
+                continue
+            token = line.split(None, 1)[0]
+            if len(token) == 81:
+                if rows:
+                    yield start, "".join(rows)
+                    rows = []
+                yield position, token
+                continue
+            cells = "".join(ch for ch in line if ch not in PuzzleIO.SEPARATOR_CHARS)
+            if not cells:
+                continue
+            if len(cells) != 9 or any(ch not in PuzzleIO.CELL_CHARS for ch in cells):
+                if rows:
+                    yield start, "".join(rows)
+                    rows = []
+                continue
+            if not rows:
+                start = position
+            rows.append(cells)
+            if len(rows) == 9:
+                yield start, "".join(rows)
+                rows = []
+        if rows:
+            yield start, "".join(rows)
+
+    @staticmethod
+    def iter_entries(lines):
+        for _, text in PuzzleIO.scan_entries(enumerate(lines)):
+            yield text
+
+    @staticmethod
+    def iter_puzzles(lines):
+        for text in PuzzleIO.iter_entries(lines):
+            board = PuzzleIO.parse_line(text)
+            if board is not None:
+                yield board
+
+    @staticmethod
+    def iter_lines(f):
+        # Reads at most MAX_LINE_BYTES of each line so a file without newlines can't exhaust memory.
+        # The rest of an overlong line is skipped in chunks, each yielded as a blank line so that
+        # offsets keep advancing for progress reporting. A leading UTF-8 BOM is dropped
+        offset = f.tell()
+        limit = PuzzleIO.MAX_LINE_BYTES
+        while True:
+            raw = f.readline(limit)
+            if not raw:
+                return
+            text = raw[3:] if offset == 0 and raw.startswith(codecs.BOM_UTF8) else raw
+            yield offset, text.decode("utf-8", "replace") if limit == PuzzleIO.MAX_LINE_BYTES else ""
+            offset += len(raw)
+            limit = PuzzleIO.MAX_LINE_BYTES if raw.endswith(b"\n") else PuzzleIO.SKIP_CHUNK_BYTES
+
+    @staticmethod
+    def read_file(path):
+        with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+            yield from PuzzleIO.iter_puzzles(f)
+
+    @staticmethod
+    def parse_entry(text, index):
+        board = PuzzleIO.parse_line(text)
+        if board is None:
+            raise ValueError(f"entry {index + 1} is not a valid puzzle")
+        return board
+
+    @staticmethod
+    def to_line(board):
+        return "".join(str(n) if n else "." for row in board for n in row)
+
+    @staticmethod
+    def to_sdk(board):
+        return "\n".join("".join(str(n) if n else "." for n in row) for row in board)
+
+    @staticmethod
+    def export_target(path, selected_filter):
+        # Returns (path, sdk): an explicit Text/SDK filter picks the format and fills in a missing
+        # extension; otherwise the extension decides
+        root, ext = os.path.splitext(path)
+        ext = ext.lower()
+        if selected_filter == PuzzleIO.SDK_FILTER:
+            return (root + ".sdk" if ext in ("", ".txt") else path), True
+        if selected_filter == PuzzleIO.TEXT_FILTER:
+            return (root + ".txt" if not ext else path), False
+        return path, ext == ".sdk"
+
+    @staticmethod
+    def write_file(path, boards, sdk=None):
+        if sdk is None:
+            sdk = path.lower().endswith(".sdk")
+        with open(path, "w", encoding="utf-8") as f:
+            for i, board in enumerate(boards):
+                if sdk:
+                    if i:
+                        f.write("\n")
+                    f.write(PuzzleIO.to_sdk(board) + "\n")
+                else:
+                    f.write(PuzzleIO.to_line(board) + "\n")
+
+
+class PuzzleIndex:
+    # Sparse byte-offset index: every STRIDE-th entry start, so any pick re-reads at most STRIDE entries
+    STRIDE = 1024
+    PROGRESS_BYTES = 1 << 22
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = array("q")
+        self.count = 0
+        self.signature = self.file_signature()
+
+    def file_signature(self):
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def is_current(self):
+        try:
+            return self.file_signature() == self.signature
+        except OSError:
+            return False
+
+    def build(self, progress=None):
+        # progress(bytes_read, total_bytes) runs every PROGRESS_BYTES and may return False to
+        # cancel; build() then returns False
+        total = self.signature[0]
+        self.offsets = array("q")
+        self.count = 0
+        state = {"cancelled": False}
+
+        def reported(lines):
+            next_report = self.PROGRESS_BYTES
+            for offset, line in lines:
+                if progress is not None and offset >= next_report:
+                    if progress(offset, total) is False:
+                        state["cancelled"] = True
+                        return
+                    next_report = offset + self.PROGRESS_BYTES
+                yield offset, line
+
+        with open(self.path, "rb") as f:
+            for offset, _ in PuzzleIO.scan_entries(reported(PuzzleIO.iter_lines(f))):
+                if self.count % self.STRIDE == 0:
+                    self.offsets.append(offset)
+                self.count += 1
+        return not state["cancelled"]
+
+    def entry(self, index):
+        # Returns None if the index is out of range or the file changed since build()
+        if not 0 <= index < self.count or not self.is_current():
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(self.offsets[index // self.STRIDE])
+            entries = PuzzleIO.scan_entries(PuzzleIO.iter_lines(f))
+            found = next(itertools.islice(entries, index % self.STRIDE, None), None)
+        return None if found is None else PuzzleIO.parse_entry(found[1], index)
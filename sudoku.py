@@ -6,11 +6,14 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QFrame, QGridLayout, QLineEdit,
     QButtonGroup, QMessageBox, QSpacerItem, QSizePolicy, QGraphicsDropShadowEffect,
-    QScrollArea, QGroupBox, QProgressBar, QInputDialog, QFileDialog
+    QScrollArea, QGroupBox, QProgressBar, QInputDialog, QFileDialog, QProgressDialog
 )
 from PyQt6.QtCore import Qt, QTranslator, QLocale, QSize, pyqtSignal, QPropertyAnimation, QEasingCurve, QTimer, QUrl
 from PyQt6.QtGui import QIcon, QFont, QPalette, QColor, QLinearGradient, QBrush, QPainter, QPen, QValidator
 
+from puzzle_io import PuzzleIO, PuzzleIndex
+from sudoku_solver import SudokuSolver
+
 class SudokuCell(QLineEdit):
     def __init__(self, row, col, parent=None):
         super().__init__(parent)
@@ -160,61 +163,6 @@ class DifficultySelector(QWidget):
         texts = ["Difficulty:", "سطح دشواری:", "难度：", "Сложность:"]
         self.label.setText(texts[idx])
 
-class SudokuSolver:
-    @staticmethod
-    def is_valid(board, row, col, num):
-        for x in range(9):
-            if board[row][x] == num or board[x][col] == num:
-                return False
-        start_row, start_col = row // 3 * 3, col // 3 * 3
-        for i in range(3):
-            for j in range(3):
-                if board[i + start_row][j + start_col] == num:
-                    return False
-        return True
-
-    @staticmethod
-    def solve(board):
-        for row in range(9):
-            for col in range(9):
-                if board[row][col] == 0:
-                    for num in range(1, 10):
-                        if SudokuSolver.is_valid(board, row, col, num):
-                            board[row][col] = num
-                            if SudokuSolver.solve(board):
-                                return True
-                            board[row][col] = 0
-                    return False
-        return True
-
-    @staticmethod
-    def generate_puzzle(difficulty=1):
-        board = [[0 for _ in range(9)] for _ in range(9)]
-        SudokuSolver.fill_diagonal(board)
-        SudokuSolver.solve(board)
-        return SudokuSolver.remove_cells(copy.deepcopy(board), difficulty)
-
-    @staticmethod
-    def fill_diagonal(board):
-        for i in range(0, 9, 3):
-            nums = list(range(1, 10))
-            random.shuffle(nums)
-            idx = 0
-            for row in range(i, i+3):
-                for col in range(i, i+3):
-                    board[row][col] = nums[idx]
-                    idx += 1
-
-    @staticmethod
-    def remove_cells(board, difficulty):
-        cells_to_remove = [45, 50, 55, 60][difficulty]
-        positions = [(i, j) for i in range(9) for j in range(9)]
-        random.shuffle(positions)
-        for i in range(cells_to_remove):
-            row, col = positions[i]
-            board[row][col] = 0
-        return board
-
 class SudokuBoard(QWidget):
     puzzle_solved = pyqtSignal()
     hint_used = pyqtSignal()
@@ -223,6 +171,7 @@ class SudokuBoard(QWidget):
         super().__init__(parent)
         self.main_window = main_window
         self.board = [[0]*9 for _ in range(9)]
+        self.puzzle = [[0]*9 for _ in range(9)]
         self.solution = [[0]*9 for _ in range(9)]
         self.cells = []
         self.mistakes = 0
@@ -299,11 +248,23 @@ class SudokuBoard(QWidget):
         self.new_btn.setFixedSize(120, 44)
         self.new_btn.clicked.connect(self.trigger_new_game)
 
+        self.import_btn = QPushButton()
+        self.import_btn.setFixedSize(120, 44)
+        self.import_btn.clicked.connect(self.trigger_import)
+
+        self.export_btn = QPushButton()
+        self.export_btn.setFixedSize(120, 44)
+        self.export_btn.clicked.connect(self.trigger_export)
+
         btn_layout.addWidget(self.hint_btn)
         btn_layout.addSpacing(12)
         btn_layout.addWidget(self.check_btn)
         btn_layout.addSpacing(12)
         btn_layout.addWidget(self.new_btn)
+        btn_layout.addSpacing(12)
+        btn_layout.addWidget(self.import_btn)
+        btn_layout.addSpacing(12)
+        btn_layout.addWidget(self.export_btn)
         btn_layout.addStretch()
 
         layout.addLayout(btn_layout)
@@ -329,18 +290,28 @@ class SudokuBoard(QWidget):
         if self.main_window:
             self.main_window.new_game()
 
+    def trigger_import(self):
+        if self.main_window:
+            self.main_window.import_puzzle()
+
+    def trigger_export(self):
+        if self.main_window:
+            self.main_window.export_puzzle()
+
     def update_texts(self):
         idx = QApplication.instance().property("lang_index") or 0
         texts = [
-            ["Hint", "Check", "New Game", "Mistakes: {}/3", "Time: {}"],
-            ["راهنمایی", "بررسی", "بازی جدید", "اشتباهات: {}/۳", "زمان: {}"],
-            ["提示", "检查", "新游戏", "错误: {}/3", "时间: {}"],
-            ["Подсказка", "Проверить", "Новая игра", "Ошибки: {}/3", "Время: {}"]
+            ["Hint", "Check", "New Game", "Mistakes: {}/3", "Time: {}", "Import", "Export"],
+            ["راهنمایی", "بررسی", "بازی جدید", "اشتباهات: {}/۳", "زمان: {}", "وارد کردن", "خروجی"],
+            ["提示", "检查", "新游戏", "错误: {}/3", "时间: {}", "导入", "导出"],
+            ["Подсказка", "Проверить", "Новая игра", "Ошибки: {}/3", "Время: {}", "Импорт", "Экспорт"]
         ]
         t = texts[idx]
         self.hint_btn.setText(t[0])
         self.check_btn.setText(t[1])
         self.new_btn.setText(t[2])
+        self.import_btn.setText(t[5])
+        self.export_btn.setText(t[6])
         self.update_stats()
 
     def update_stats(self):
@@ -367,6 +338,7 @@ class SudokuBoard(QWidget):
 
     def load_puzzle(self, puzzle, solution, difficulty):
         self.board = [row[:] for row in puzzle]
+        self.puzzle = [row[:] for row in puzzle]
         self.solution = [row[:] for row in solution]
         self.mistakes = 0
         self.hints_used = 0
@@ -450,6 +422,7 @@ class MainWindow(QMainWindow):
         self.setFixedSize(900, 760)
         self.setWindowIcon(QIcon(self.resource_path("icon.ico")))
         self.difficulty = 0
+        self.puzzle_index = None
         self.setup_ui()
         self.apply_theme("Windows Default")
         self.apply_language("en")
@@ -510,6 +483,111 @@ class MainWindow(QMainWindow):
         SudokuSolver.solve(solution)
         self.game_board.load_puzzle(puzzle, solution, self.difficulty)
 
+    def import_puzzle(self):
+        idx = QApplication.instance().property("lang_index") or 0
+        path, _ = QFileDialog.getOpenFileName(
+            self, ["Import Puzzle", "وارد کردن پازل", "导入谜题", "Импорт головоломки"][idx], "", PuzzleIO.FILE_FILTER
+        )
+        if not path:
+            return
+
+        try:
+            index = self.load_puzzle_index(path)
+        except OSError as e:
+            self.show_io_error(str(e))
+            return
+        if index is None:
+            return
+        if index.count == 0:
+            self.show_io_error(["No puzzles found in this file.", "پازلی در این فایل یافت نشد.",
+                                "该文件中没有谜题。", "В этом файле нет головоломок."][idx])
+            return
+
+        number, ok = QInputDialog.getInt(
+            self, ["Import Puzzle", "وارد کردن پازل", "导入谜题", "Импорт головоломки"][idx],
+            ["Puzzle number (1-{}, in file order, invalid entries included):",
+             "شماره پازل (۱ تا {}، به ترتیب فایل، با احتساب موارد نامعتبر):",
+             "谜题编号（1-{}，按文件顺序，包括无效条目）：",
+             "Номер головоломки (1-{}, по порядку в файле, включая неверные записи):"][idx].format(index.count),
+            1, 1, index.count
+        )
+        if not ok:
+            return
+
+        try:
+            puzzle = index.entry(number - 1)
+        except OSError as e:
+            self.show_io_error(str(e))
+            return
+        except ValueError:
+            self.show_io_error(["Entry {} is not a valid puzzle.", "مورد {} پازل معتبری نیست.",
+                                "第 {} 项不是有效的谜题。", "Запись {} не является корректной головоломкой."][idx].format(number))
+            return
+        if puzzle is None:
+            self.show_io_error(["No puzzle found at that position.", "پازلی در این شماره یافت نشد.",
+                                "该位置没有谜题。", "Головоломка с таким номером не найдена."][idx])
+            return
+
+        status, solution = SudokuSolver.solve_unique(puzzle)
+        errors = {
+            SudokuSolver.NO_SOLUTION: ["This puzzle has no solution.", "این پازل راه‌حلی ندارد.",
+                                   "该谜题无解。", "У этой головоломки нет решения."],
+            SudokuSolver.MULTIPLE_SOLUTIONS: ["This puzzle has more than one solution.", "این پازل بیش از یک راه‌حل دارد.",
+                                          "该谜题有多个解。", "У этой головоломки больше одного решения."],
+            SudokuSolver.TOO_HARD: ["This puzzle is too hard to verify.", "بررسی این پازل بیش از حد دشوار است.",
+                                "该谜题太难，无法验证。", "Эту головоломку слишком сложно проверить."]
+        }
+        if status != SudokuSolver.SOLVED:
+            self.show_io_error(errors[status][idx])
+            return
+        self.game_board.load_puzzle(puzzle, solution, self.difficulty)
+
+    def load_puzzle_index(self, path):
+        if self.puzzle_index is not None and self.puzzle_index.path == path and self.puzzle_index.is_current():
+            return self.puzzle_index
+        idx = QApplication.instance().property("lang_index") or 0
+        index = PuzzleIndex(path)
+        dialog = QProgressDialog(
+            ["Reading puzzles...", "در حال خواندن پازل‌ها...", "正在读取谜题...", "Чтение головоломок..."][idx],
+            ["Cancel", "لغو", "取消", "Отмена"][idx], 0, 1000, self
+        )
+        dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        dialog.setMinimumDuration(500)
+
+        def progress(done, total):
+            dialog.setValue(int(done * 1000 / total) if total else 0)
+            QApplication.processEvents()
+            return not dialog.wasCanceled()
+
+        try:
+            built = index.build(progress)
+        finally:
+            dialog.close()
+        if not built:
+            return None
+        self.puzzle_index = index
+        return index
+
+    def export_puzzle(self):
+        idx = QApplication.instance().property("lang_index") or 0
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, ["Export Puzzle", "خروجی پازل", "导出谜题", "Экспорт головоломки"][idx], "puzzle.txt", PuzzleIO.FILE_FILTER
+        )
+        if not path:
+            return
+        path, sdk = PuzzleIO.export_target(path, selected_filter)
+        try:
+            PuzzleIO.write_file(path, [self.game_board.puzzle], sdk)
+        except OSError as e:
+            self.show_io_error(str(e))
+
+    def show_io_error(self, text):
+        msg = QMessageBox()
+        msg.setWindowTitle("Error")
+        msg.setText(text)
+        msg.setIcon(QMessageBox.Icon.Warning)
+        msg.exec()
+
     def set_difficulty(self, level):
         self.difficulty = level
         self.new_game()
@@ -0,0 +1,149 @@
+import random
+import copy
+
+
+class SudokuSolver:
+    SOLVE_STEP_LIMIT = 200000
+    BIT_COUNT = [bin(mask).count("1") for mask in range(1 << 10)]
+    SOLVED, NO_SOLUTION, MULTIPLE_SOLUTIONS, TOO_HARD = "solved", "no_solution", "multiple_solutions", "too_hard"
+
+    @staticmethod
+    def is_valid(board, row, col, num):
+        for x in range(9):
+            if board[row][x] == num or board[x][col] == num:
+                return False
+        start_row, start_col = row // 3 * 3, col // 3 * 3
+        for i in range(3):
+            for j in range(3):
+                if board[i + start_row][j + start_col] == num:
+                    return False
+        return True
+
+    @staticmethod
+    def solve(board):
+        for row in range(9):
+            for col in range(9):
+                if board[row][col] == 0:
+                    for num in range(1, 10):
+                        if SudokuSolver.is_valid(board, row, col, num):
+                            board[row][col] = num
+                            if SudokuSolver.solve(board):
+                                return True
+                            board[row][col] = 0
+                    return False
+        return True
+
+    @staticmethod
+    def generate_puzzle(difficulty=1):
+        board = [[0 for _ in range(9)] for _ in range(9)]
+        SudokuSolver.fill_diagonal(board)
+        SudokuSolver.solve(board)
+        return SudokuSolver.remove_cells(copy.deepcopy(board), difficulty)
+
+    @staticmethod
+    def fill_diagonal(board):
+        for i in range(0, 9, 3):
+            nums = list(range(1, 10))
+            random.shuffle(nums)
+            idx = 0
+            for row in range(i, i+3):
+                for col in range(i, i+3):
+                    board[row][col] = nums[idx]
+                    idx += 1
+
+    @staticmethod
+    def remove_cells(board, difficulty):
+        cells_to_remove = [45, 50, 55, 60][difficulty]
+        positions = [(i, j) for i in range(9) for j in range(9)]
+        random.shuffle(positions)
+        for i in range(cells_to_remove):
+            row, col = positions[i]
+            board[row][col] = 0
+        return board
+
+    @staticmethod
+    def is_consistent(board):
+        seen = set()
+        for row in range(9):
+            for col in range(9):
+                num = board[row][col]
+                if num == 0:
+                    continue
+                keys = (("r", row, num), ("c", col, num), ("b", row // 3 * 3 + col // 3, num))
+                if any(key in seen for key in keys):
+                    return False
+                seen.update(keys)
+        return True
+
+    @staticmethod
+    def solve_unique(board, max_steps=None):
+        # Bitmask candidates with most-constrained-cell-first search; stops at a second
+        # solution or after max_steps so a hostile puzzle cannot stall the caller
+        if max_steps is None:
+            max_steps = SudokuSolver.SOLVE_STEP_LIMIT
+        if not SudokuSolver.is_consistent(board):
+            return SudokuSolver.NO_SOLUTION, None
+        grid = [n for row in board for n in row]
+        rows, cols, boxes = [0] * 9, [0] * 9, [0] * 9
+        empty = []
+        for i, num in enumerate(grid):
+            row, col = divmod(i, 9)
+            box = row // 3 * 3 + col // 3
+            if num:
+                rows[row] |= 1 << num
+                cols[col] |= 1 << num
+                boxes[box] |= 1 << num
+            else:
+                empty.append((i, row, col, box))
+        solutions = []
+        state = {"steps": 0, "aborted": False}
+
+        def search():
+            if not empty:
+                solutions.append(grid[:])
+                return len(solutions) > 1
+            state["steps"] += 1
+            if state["steps"] > max_steps:
+                state["aborted"] = True
+                return True
+            best, best_free, best_count = 0, 0, 10
+            for k, (i, row, col, box) in enumerate(empty):
+                free = 0x3FE & ~(rows[row] | cols[col] | boxes[box])
+                count = SudokuSolver.BIT_COUNT[free]
+                if count < best_count:
+                    best, best_free, best_count = k, free, count
+                    if count <= 1:
+                        break
+            if best_count == 0:
+                return False
+            cell = empty.pop(best)
+            i, row, col, box = cell
+            free = best_free
+            while free:
+                bit = free & -free
+                free ^= bit
+                grid[i] = bit.bit_length() - 1
+                rows[row] |= bit
+                cols[col] |= bit
+                boxes[box] |= bit
+                done = search()
+                rows[row] ^= bit
+                cols[col] ^= bit
+                boxes[box] ^= bit
+                if done:
+                    break
+            else:
+                done = False
+            grid[i] = 0
+            empty.insert(best, cell)
+            return done
+
+        search()
+        if state["aborted"]:
+            return SudokuSolver.TOO_HARD, None
+        if not solutions:
+            return SudokuSolver.NO_SOLUTION, None
+        if len(solutions) > 1:
+            return SudokuSolver.MULTIPLE_SOLUTIONS, None
+        solution = solutions[0]
+        return SudokuSolver.SOLVED, [solution[i:i + 9] for i in range(0, 81, 9)]
@@ -0,0 +1,162 @@
+import io
+import os
+import tempfile
+import tracemalloc
+
+import pytest
+
+from puzzle_io import PuzzleIO, PuzzleIndex
+
+LINE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SDK_ROWS = ["53..7....", "6..195...", ".98....6.", "8...6...3", "4..8.3..1",
+            "7...2...6", ".6....28.", "...419..5", "....8..79"]
+
+
+def parse(text):
+    return list(PuzzleIO.iter_puzzles(io.StringIO(text)))
+
+
+def test_line_with_trailing_metadata():
+    boards = parse(LINE + " ; rating 1.2\n" + LINE.replace(".", "0") + "\t#42\n")
+    assert len(boards) == 2
+    assert boards[0] == boards[1]
+    assert boards[0][0] == [5, 3, 0, 0, 7, 0, 0, 0, 0]
+
+
+def test_sdk_grid_with_separators():
+    grid = []
+    for i, row in enumerate(SDK_ROWS):
+        grid.append(" | ".join([row[:3], row[3:6], row[6:]]))
+        if i in (2, 5):
+            grid.append("------+-------+------")
+    boards = parse("#Aauthor\n" + "\n".join(grid) + "\n")
+    assert [PuzzleIO.to_line(b) for b in boards] == [LINE]
+
+
+def test_comment_resets_partial_grid():
+    text = "\n".join(SDK_ROWS[:4] + ["# comment"] + SDK_ROWS) + "\n"
+    assert [PuzzleIO.to_line(b) for b in parse(text)] == [LINE]
+
+
+def test_malformed_line_is_skipped():
+    bad = LINE[:-1] + "x"
+    assert [PuzzleIO.to_line(b) for b in parse(bad + "\n" + LINE + "\n")] == [LINE]
+
+
+def test_write_file_round_trip():
+    boards = parse(LINE + "\n") * 3
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("puzzles.txt", "puzzles.sdk"):
+            path = os.path.join(tmp, name)
+            PuzzleIO.write_file(path, boards)
+            assert list(PuzzleIO.read_file(path)) == boards
+
+
+def test_export_target():
+    assert PuzzleIO.export_target("/tmp/puzzle.txt", PuzzleIO.SDK_FILTER) == ("/tmp/puzzle.sdk", True)
+    assert PuzzleIO.export_target("/tmp/puzzle", PuzzleIO.SDK_FILTER) == ("/tmp/puzzle.sdk", True)
+    assert PuzzleIO.export_target("/tmp/puzzle", PuzzleIO.TEXT_FILTER) == ("/tmp/puzzle.txt", False)
+    assert PuzzleIO.export_target("/tmp/puzzle.sdk", "All files (*)") == ("/tmp/puzzle.sdk", True)
+    assert PuzzleIO.export_target("/tmp/puzzle", "All files (*)") == ("/tmp/puzzle", False)
+
+
+def test_write_file_explicit_format():
+    board = PuzzleIO.parse_line(LINE)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "puzzle")
+        PuzzleIO.write_file(path, [board], sdk=True)
+        with open(path) as f:
+            assert f.read().splitlines() == SDK_ROWS
+
+
+def test_invalid_entries_keep_numbering():
+    bad = LINE[:-1] + "x"
+    text = "\n".join(["header text", LINE, bad] + SDK_ROWS[:4] + ["# comment"] + SDK_ROWS) + "\n"
+    entries = list(PuzzleIO.iter_entries(io.StringIO(text)))
+    assert entries == [LINE, bad, "".join(SDK_ROWS[:4]), LINE]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mixed.txt")
+        with open(path, "w") as f:
+            f.write(text)
+        index = PuzzleIndex(path)
+        assert index.build()
+        assert index.count == 4
+        assert index.entry(0) == PuzzleIO.parse_line(LINE)
+        with pytest.raises(ValueError, match="entry 2"):
+            index.entry(1)
+        with pytest.raises(ValueError, match="entry 3"):
+            index.entry(2)
+        assert index.entry(3) == PuzzleIO.parse_line(LINE)
+
+
+def test_index_matches_sequential_read():
+    boards = [PuzzleIO.parse_line(LINE.replace(".", str(n % 10), 1)) for n in range(20)]
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("puzzles.txt", "puzzles.sdk"):
+            path = os.path.join(tmp, name)
+            PuzzleIO.write_file(path, boards)
+            index = PuzzleIndex(path)
+            index.STRIDE = 3
+            assert index.build()
+            assert index.count == len(boards)
+            assert [index.entry(i) for i in range(len(boards))] == boards
+            assert index.entry(len(boards)) is None
+            assert index.is_current()
+
+
+def test_utf8_bom_is_ignored():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in (("bom.txt", LINE + "\n" + LINE + "\n"), ("bom.sdk", "\n".join(SDK_ROWS) + "\n")):
+            path = os.path.join(tmp, name)
+            with open(path, "w", encoding="utf-8-sig") as f:
+                f.write(text)
+            expected = PuzzleIO.parse_line(LINE)
+            assert next(PuzzleIO.read_file(path)) == expected
+            index = PuzzleIndex(path)
+            assert index.build()
+            assert index.entry(0) == expected
+
+
+def test_index_entry_after_file_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "puzzles.txt")
+        PuzzleIO.write_file(path, [PuzzleIO.parse_line(LINE)] * 3)
+        index = PuzzleIndex(path)
+        assert index.build()
+        with open(path, "w") as f:
+            f.write(LINE + "\n")
+        assert index.entry(2) is None
+        # Same size and timestamp as when built, but fewer entries than indexed
+        index.signature = index.file_signature()
+        assert index.entry(2) is None
+
+
+def test_index_build_can_be_cancelled():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "puzzles.txt")
+        PuzzleIO.write_file(path, [PuzzleIO.parse_line(LINE)] * 10)
+        index = PuzzleIndex(path)
+        index.PROGRESS_BYTES = 100
+        assert index.build(lambda done, total: False) is False
+
+
+def test_index_over_newline_free_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "blob.bin")
+        with open(path, "w") as f:
+            for _ in range(16):
+                f.write("1" * (1 << 20))
+            f.write("\n" + LINE + "\n")
+        index = PuzzleIndex(path)
+        index.PROGRESS_BYTES = 1 << 20
+        reports = []
+        tracemalloc.start()
+        try:
+            assert index.build(lambda done, total: reports.append(done))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 8 << 20
+        assert len(reports) >= 10
+        assert index.count == 1
+        assert index.entry(0) == PuzzleIO.parse_line(LINE)
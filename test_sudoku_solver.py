@@ -0,0 +1,48 @@
+from sudoku_solver import SudokuSolver
+
+LINE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+
+def parse(text):
+    return [[0 if ch == "." else int(ch) for ch in text[i:i + 9]] for i in range(0, 81, 9)]
+
+
+def test_is_consistent():
+    board = parse(LINE)
+    assert SudokuSolver.is_consistent(board)
+    board[0][2] = 5
+    assert not SudokuSolver.is_consistent(board)
+
+
+def test_solve_unique():
+    status, solution = SudokuSolver.solve_unique(parse(LINE))
+    assert status == SudokuSolver.SOLVED
+    assert SudokuSolver.is_consistent(solution)
+    assert all(n for row in solution for n in row)
+
+
+def test_solve_hard_puzzle_within_limit():
+    hard = "..............3.85..1.2.......5.7.....4...1...9.......5......73..2.1........4...9"
+    assert SudokuSolver.solve_unique(parse(hard))[0] == SudokuSolver.SOLVED
+    assert SudokuSolver.solve_unique(parse(hard), max_steps=1000) == (SudokuSolver.TOO_HARD, None)
+
+
+def test_solve_rejects_bad_puzzles():
+    assert SudokuSolver.solve_unique(parse("." * 81)) == (SudokuSolver.MULTIPLE_SOLUTIONS, None)
+    board = parse(LINE)
+    board[0][2] = 5
+    assert SudokuSolver.solve_unique(board) == (SudokuSolver.NO_SOLUTION, None)
+    # Consistent givens, but cell (0, 2) has no candidate left
+    board = parse("12.67....345......" + "." * 63)
+    board[3][2] = 8
+    board[4][2] = 9
+    assert SudokuSolver.is_consistent(board)
+    assert SudokuSolver.solve_unique(board) == (SudokuSolver.NO_SOLUTION, None)
+
+
+def test_generate_puzzle_is_solvable():
+    puzzle = SudokuSolver.generate_puzzle(0)
+    assert sum(1 for row in puzzle for n in row if n == 0) == 45
+    assert SudokuSolver.is_consistent(puzzle)
+    assert SudokuSolver.solve(puzzle)
+    assert all(n for row in puzzle for n in row)